@@ -5,6 +5,7 @@ use actix_cors::Cors;
 use actix_web::{http, middleware, web, App, Error as HttpError, HttpResponse, HttpServer};
 use futures::Future;
 use futures::FutureExt;
+use futures::StreamExt;
 use prometheus;
 use serde::{Deserialize, Serialize};
 use serde_json::{json, Value};
@@ -51,6 +52,11 @@ impl Default for RpcPollingConfig {
     }
 }
 
+/// Maximum number of requests in a single JSON RPC batch.
+const MAX_BATCH_SIZE: usize = 100;
+/// Maximum number of requests of a single batch that are processed concurrently.
+const MAX_BATCH_CONCURRENCY: usize = 10;
+
 #[derive(Serialize, Deserialize, Clone, Debug)]
 pub struct RpcLimitsConfig {
     /// Maximum byte size of the json payload.
@@ -205,14 +211,38 @@ struct JsonRpcHandler {
 
 impl JsonRpcHandler {
     pub async fn process(&self, message: Message) -> Result<Message, HttpError> {
-        let id = message.id();
         match message {
-            Message::Request(request) => {
-                Ok(Message::response(id, self.process_request(request).await))
+            Message::Batch(messages) if messages.is_empty() || messages.len() > MAX_BATCH_SIZE => {
+                Ok(Message::error(RpcError::new(
+                    -32_600,
+                    "Invalid request".to_owned(),
+                    Some(Value::String(format!(
+                        "Batch must contain from 1 to {} requests, got {}",
+                        MAX_BATCH_SIZE,
+                        messages.len()
+                    ))),
+                )))
             }
-            _ => Ok(Message::error(RpcError::parse_error(
+            // Responses keep the order of requests.
+            Message::Batch(messages) => Ok(Message::Batch(
+                futures::stream::iter(
+                    messages.into_iter().map(|message| self.process_single(message)),
+                )
+                .buffered(MAX_BATCH_CONCURRENCY)
+                .collect()
+                .await,
+            )),
+            message => Ok(self.process_single(message).await),
+        }
+    }
+
+    async fn process_single(&self, message: Message) -> Message {
+        let id = message.id();
+        match message {
+            Message::Request(request) => Message::response(id, self.process_request(request).await),
+            _ => Message::error(RpcError::parse_error(
                 "JSON RPC Request format was expected".to_owned(),
-            ))),
+            )),
         }
     }
 
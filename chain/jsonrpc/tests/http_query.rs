@@ -1,5 +1,6 @@
 use actix::System;
 use futures::{future, FutureExt};
+use serde_json::json;
 
 use near_actix_test_utils::run_actix;
 use near_jsonrpc::client::new_http_client;
@@ -26,3 +27,61 @@ fn test_status() {
         }));
     });
 }
+
+/// Send several JSON RPC requests as a single batch.
+#[test]
+fn test_batch_request() {
+    init_test_logger();
+
+    run_actix(async {
+        let (_view_client_addr, addr) = test_utils::start_all(test_utils::NodeType::NonValidator);
+
+        actix::spawn(async move {
+            let request = json!([
+                {"jsonrpc": "2.0", "method": "status", "params": [], "id": 0},
+                {"jsonrpc": "2.0", "method": "unknown_method", "params": [], "id": 1},
+                {"jsonrpc": "2.0", "method": "status", "params": [], "id": 2},
+            ]);
+            let mut response = awc::Client::new()
+                .post(format!("http://{}", addr))
+                .send_json(&request)
+                .await
+                .unwrap();
+            let res: serde_json::Value = response.json().await.unwrap();
+            let responses = res.as_array().unwrap();
+            assert_eq!(responses.len(), 3);
+            for (i, response) in responses.iter().enumerate() {
+                assert_eq!(response["id"], i);
+            }
+            assert_eq!(responses[0]["result"]["chain_id"], "unittest");
+            assert!(responses[1]["error"].is_object());
+            assert_eq!(responses[2]["result"]["chain_id"], "unittest");
+            System::current().stop();
+        });
+    });
+}
+
+/// An empty or too large batch is rejected with a single error.
+#[test]
+fn test_invalid_batch_request() {
+    init_test_logger();
+
+    run_actix(async {
+        let (_view_client_addr, addr) = test_utils::start_all(test_utils::NodeType::NonValidator);
+
+        actix::spawn(async move {
+            let status_request =
+                json!({"jsonrpc": "2.0", "method": "status", "params": [], "id": 0});
+            for request in &[json!([]), json!(vec![status_request; 101])] {
+                let mut response = awc::Client::new()
+                    .post(format!("http://{}", addr))
+                    .send_json(request)
+                    .await
+                    .unwrap();
+                let res: serde_json::Value = response.json().await.unwrap();
+                assert_eq!(res["error"]["code"], -32_600);
+            }
+            System::current().stop();
+        });
+    });
+}
@@ -1,12 +1,12 @@
 import base64
 import json
-import requests
 import time
 
 from transaction import (
     sign_payment_tx, sign_deploy_contract_tx, sign_function_call_tx,
     sign_create_account_with_full_access_key_and_balance_tx, sign_staking_tx)
 from key import Key
+from jsonrpc_client import get_session
 from utils import load_binary_file
 
 
@@ -26,9 +26,9 @@ class Account:
             'id': 'dontcare',
             'jsonrpc': '2.0'
         }
-        r = requests.post(f'http://{self.rpc_addr}:{self.rpc_port}',
-                          json=j,
-                          timeout=10)
+        r = get_session().post(f'http://{self.rpc_addr}:{self.rpc_port}',
+                               json=j,
+                               timeout=10)
         return json.loads(r.content)
 
     def send_tx(self, signed_tx):
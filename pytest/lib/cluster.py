@@ -22,6 +22,7 @@ import network
 from proxy import NodesProxy
 from bridge import GanacheNode, RainbowBridge, alice, bob, carol
 from configured_logger import logger
+from jsonrpc_client import get_session, send_batch
 from key import Key
 
 os.environ["ADVERSARY_CONSENT"] = "1"
@@ -107,12 +108,17 @@ class BaseNode(object):
             'id': 'dontcare',
             'jsonrpc': '2.0'
         }
-        r = requests.post("http://%s:%s" % self.rpc_addr(),
-                          json=j,
-                          timeout=timeout)
+        r = get_session().post("http://%s:%s" % self.rpc_addr(),
+                               json=j,
+                               timeout=timeout)
         r.raise_for_status()
         return json.loads(r.content)
 
+    def json_rpc_batch(self, calls, timeout=2):
+        """ Send a list of (method, params) calls as one JSON RPC batch request.
+        Responses are returned in the same order as the calls. """
+        return send_batch("http://%s:%s" % self.rpc_addr(), calls, timeout)
+
     def send_tx(self, signed_tx):
         return self.json_rpc('broadcast_tx_async',
                              [base64.b64encode(signed_tx).decode('utf8')])
@@ -123,7 +129,8 @@ class BaseNode(object):
                              timeout=timeout)
 
     def get_status(self, check_storage=True, timeout=2):
-        r = requests.get("http://%s:%s/status" % self.rpc_addr(), timeout=timeout)
+        r = get_session().get("http://%s:%s/status" % self.rpc_addr(),
+                              timeout=timeout)
         r.raise_for_status()
         status = json.loads(r.content)
         if check_storage and status['sync_info']['syncing'] == False:
@@ -162,6 +169,13 @@ class BaseNode(object):
             "finality": finality
         })
 
+    def get_accounts(self, accs, finality='optimistic'):
+        return self.json_rpc_batch([('query', {
+            "request_type": "view_account",
+            "account_id": acc,
+            "finality": finality
+        }) for acc in accs])
+
     def call_function(self, acc, method, args, finality='optimistic', timeout=2):
         return self.json_rpc('query', {
             "request_type": "call_function",
@@ -484,7 +498,7 @@ chmod +x near
         return super().json_rpc(method, params, timeout=timeout)
 
     def get_status(self):
-        r = nretry(lambda: requests.get(
+        r = nretry(lambda: get_session().get(
             "http://%s:%s/status" % self.rpc_addr(), timeout=15),
                            timeout=45)
         r.raise_for_status()
@@ -0,0 +1,65 @@
+import json
+import os
+import requests
+
+# Largest batch the node accepts, see MAX_BATCH_SIZE in chain/jsonrpc.
+MAX_BATCH_SIZE = 100
+
+_session = None
+
+
+def get_session():
+    """ Keep-alive HTTP session shared by RPC calls of the current process, so
+    that calls to the same node reuse connections instead of paying a TCP
+    handshake per request. """
+    global _session
+    if _session is None:
+        _session = requests.Session()
+        _session.mount(
+            'http://',
+            requests.adapters.HTTPAdapter(pool_connections=20,
+                                          pool_maxsize=100))
+    return _session
+
+
+def _forget_session_after_fork():
+    # A forked child must not reuse the pooled sockets of its parent: both
+    # processes would then read and write the same connections. Dropping the
+    # reference only closes the child's copies of the file descriptors.
+    global _session
+    _session = None
+
+
+os.register_at_fork(after_in_child=_forget_session_after_fork)
+
+
+class BatchRequestError(Exception):
+    pass
+
+
+def send_batch(url, calls, timeout):
+    """ Send a list of (method, params) calls to `url` as JSON RPC batch
+    requests of at most MAX_BATCH_SIZE calls each. Responses are returned in
+    the same order as the calls. """
+    responses = []
+    for start in range(0, len(calls), MAX_BATCH_SIZE):
+        responses += _send_one_batch(url, calls[start:start + MAX_BATCH_SIZE],
+                                     timeout)
+    return responses
+
+
+def _send_one_batch(url, calls, timeout):
+    j = [{
+        'method': method,
+        'params': params,
+        'id': i,
+        'jsonrpc': '2.0'
+    } for i, (method, params) in enumerate(calls)]
+    r = get_session().post(url, json=j, timeout=timeout)
+    r.raise_for_status()
+    responses = json.loads(r.content)
+    # A node without batch support, or one rejecting the whole batch, replies
+    # with a single error object instead of an array.
+    if not isinstance(responses, list):
+        raise BatchRequestError(f'JSON RPC batch request failed: {responses}')
+    return sorted(responses, key=lambda res: res['id'])
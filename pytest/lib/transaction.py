@@ -1,4 +1,5 @@
 from serializer import BinarySerializer
+import functools
 import hashlib
 from ed25519 import SigningKey
 import base58
@@ -10,7 +11,8 @@ from messages.bridge import *
 schema = dict(tx_schema + crypto_schema + bridge_schema)
 
 
-def compute_tx_hash(receiverId, nonce, actions, blockHash, accountId, pk):
+def serialize_transaction(receiverId, nonce, actions, blockHash, accountId,
+                          pk):
     tx = Transaction()
     tx.signerId = accountId
     tx.publicKey = PublicKey()
@@ -21,26 +23,34 @@ def compute_tx_hash(receiverId, nonce, actions, blockHash, accountId, pk):
     tx.actions = actions
     tx.blockHash = blockHash
 
-    msg = BinarySerializer(schema).serialize(tx)
+    return tx, BinarySerializer(schema).serialize(tx)
+
+
+def compute_tx_hash(receiverId, nonce, actions, blockHash, accountId, pk):
+    tx, msg = serialize_transaction(receiverId, nonce, actions, blockHash,
+                                    accountId, pk)
     hash_ = hashlib.sha256(msg).digest()
 
     return tx, hash_
 
 
-def sign_and_serialize_transaction(receiverId, nonce, actions, blockHash,
-                                   accountId, pk, sk):
-    tx, hash_ = compute_tx_hash(receiverId, nonce, actions, blockHash,
-                                accountId, pk)
-
+def serialize_signed_transaction(tx_bytes, signature_data):
     signature = Signature()
     signature.keyType = 0
-    signature.data = SigningKey(sk).sign(hash_)
+    signature.data = signature_data
 
-    signedTx = SignedTransaction()
-    signedTx.transaction = tx
-    signedTx.signature = signature
+    # A serialized SignedTransaction is the serialized transaction followed
+    # by the serialized signature, so the transaction bytes are reused as is.
+    return tx_bytes + BinarySerializer(schema).serialize(signature)
 
-    return BinarySerializer(schema).serialize(signedTx)
+
+def sign_and_serialize_transaction(receiverId, nonce, actions, blockHash,
+                                   accountId, pk, sk):
+    _, msg = serialize_transaction(receiverId, nonce, actions, blockHash,
+                                   accountId, pk)
+    hash_ = hashlib.sha256(msg).digest()
+
+    return serialize_signed_transaction(msg, SigningKey(sk).sign(hash_))
 
 
 def create_create_account_action():
@@ -162,11 +172,34 @@ def sign_delete_access_key_tx(signer_key, target_account_id, key_for_deletion,
                                           signer_key.decoded_sk())
 
 
+@functools.lru_cache(maxsize=1024)
+def _payment_tx_template(receiverId, amount, blockHash, accountId, pk):
+    # Nonce is the only field that differs between payments of the same
+    # shape, so serialize everything else once and keep the sha256 state of
+    # the bytes preceding the nonce.
+    _, msg = serialize_transaction(receiverId, 0,
+                                   [create_payment_action(amount)], blockHash,
+                                   accountId, pk)
+    # signerId (u32 length + utf8 bytes), then publicKey (u8 key type + 32
+    # bytes of key data).
+    nonce_offset = 4 + len(accountId.encode('utf8')) + 1 + len(pk)
+    prefix = msg[:nonce_offset]
+    return prefix, msg[nonce_offset + 8:], hashlib.sha256(prefix)
+
+
 def sign_payment_tx(key, to, amount, nonce, blockHash):
-    action = create_payment_action(amount)
-    return sign_and_serialize_transaction(to, nonce, [action], blockHash,
-                                          key.account_id, key.decoded_pk(),
-                                          key.decoded_sk())
+    prefix, suffix, prefix_hash = _payment_tx_template(to, amount,
+                                                       bytes(blockHash),
+                                                       key.account_id,
+                                                       key.decoded_pk())
+    nonce_bytes = nonce.to_bytes(8, 'little')
+    m = prefix_hash.copy()
+    m.update(nonce_bytes)
+    m.update(suffix)
+
+    return serialize_signed_transaction(
+        prefix + nonce_bytes + suffix,
+        SigningKey(key.decoded_sk()).sign(m.digest()))
 
 
 def sign_payment_tx_and_get_hash(key, to, amount, nonce, block_hash):
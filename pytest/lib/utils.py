@@ -337,3 +337,23 @@ def wait_for_blocks_or_timeout(node, num_blocks, timeout, callback=None, check_s
             if callback():
                 break
         time.sleep(check_sec)
+
+
+def poll_until(predicate,
+               timeout,
+               interval=0.2,
+               backoff=1.5,
+               max_interval=2.0):
+    """ Call `predicate` until it returns a truthy value and return that value.
+    The sleep between calls grows by `backoff` up to `max_interval`. Raises
+    TimeoutError if the value is still falsy after `timeout` seconds. """
+    deadline = time.time() + timeout
+    while True:
+        result = predicate()
+        if result:
+            return result
+        remaining = deadline - time.time()
+        if remaining <= 0:
+            raise TimeoutError(f'Condition not met within {timeout} seconds')
+        time.sleep(min(interval, remaining))
+        interval = min(interval * backoff, max_interval)
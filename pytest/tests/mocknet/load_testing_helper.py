@@ -4,9 +4,9 @@
 
 import base58
 import base64
-import requests
+from concurrent.futures import ThreadPoolExecutor
 import json
-from rc import pmap, run
+from rc import run
 import sys
 import random
 import string
@@ -16,6 +16,7 @@ sys.path.append('lib')
 from key import Key
 from mocknet import NUM_NODES, TX_OUT_FILE
 from account import Account
+from jsonrpc_client import BatchRequestError, get_session, send_batch
 
 LOCAL_ADDR = '127.0.0.1'
 RPC_PORT = '3030'
@@ -28,33 +29,55 @@ CONTRACT_DEPLOY_TIME = 10 * NUM_ACCOUNTS
 TRANSFER_ONLY_TIMEOUT = 10 * 60
 ALL_TX_TIMEOUT = 10 * 60
 
+# One worker per account so that a transaction of every account can be in
+# flight at the same time. NUM_ACCOUNTS (100) must not exceed pool_maxsize
+# (100) of the keep-alive pool from `jsonrpc_client.get_session()`, so that
+# every worker gets a pooled connection instead of opening a throwaway one.
+executor = ThreadPoolExecutor(max_workers=NUM_ACCOUNTS)
+
 
 def load_testing_account_id(i):
     return f'load_testing_{i}'
 
 
 def get_status():
-    r = requests.get(f'http://{LOCAL_ADDR}:{RPC_PORT}/status', timeout=10)
+    r = get_session().get(f'http://{LOCAL_ADDR}:{RPC_PORT}/status',
+                          timeout=10)
     r.raise_for_status()
     return json.loads(r.content)
 
 
 def json_rpc(method, params):
     j = {'method': method, 'params': params, 'id': 'dontcare', 'jsonrpc': '2.0'}
-    r = requests.post(f'http://{LOCAL_ADDR}:{RPC_PORT}', json=j, timeout=10)
+    r = get_session().post(f'http://{LOCAL_ADDR}:{RPC_PORT}',
+                           json=j,
+                           timeout=10)
     return json.loads(r.content)
 
 
-def get_nonce_for_pk(account_id, pk, finality='optimistic'):
-    access_keys = json_rpc(
-        'query', {
-            "request_type": "view_access_key_list",
-            "account_id": account_id,
-            "finality": finality
-        })
-    for k in access_keys['result']['keys']:
-        if k['public_key'] == pk:
-            return k['access_key']['nonce']
+def get_nonces_for_pk(account_ids, pk, finality='optimistic'):
+    """ Fetch nonces of `pk` for all given accounts with batch requests,
+    falling back to one request per account on nodes without batch support.
+    The nonce is None for accounts that don't exist or don't have the key. """
+    calls = [('query', {
+        "request_type": "view_access_key_list",
+        "account_id": account_id,
+        "finality": finality
+    }) for account_id in account_ids]
+    try:
+        all_access_keys = send_batch(f'http://{LOCAL_ADDR}:{RPC_PORT}',
+                                     calls,
+                                     timeout=10)
+    except BatchRequestError:
+        all_access_keys = [json_rpc(method, params) for method, params in calls]
+    nonces = []
+    for access_keys in all_access_keys:
+        keys = access_keys.get('result', {}).get('keys', [])
+        nonces.append(
+            next((k['access_key']['nonce']
+                  for k in keys
+                  if k['public_key'] == pk), None))
+    return nonces
 
 
 def get_latest_block_hash():
@@ -85,13 +108,14 @@ def random_transaction(account_and_index, i0):
 
 
 def send_transfers(i0):
-    pmap(
-        lambda account_and_index: send_transfer(account_and_index[
-            0], account_and_index[1], i0), test_accounts)
+    list(
+        executor.map(
+            lambda account_and_index: send_transfer(account_and_index[
+                0], account_and_index[1], i0), test_accounts))
 
 
 def send_random_transactions(i0):
-    pmap(lambda x: random_transaction(x, i0), test_accounts)
+    list(executor.map(lambda x: random_transaction(x, i0), test_accounts))
 
 
 def throttle_txns(send_txns, total_tx_sent, elapsed_time, max_tps, i0):
@@ -134,10 +158,20 @@ def get_test_accounts_from_args():
 
     base_block_hash = get_latest_block_hash()
     rpc_info = (LOCAL_ADDR, RPC_PORT)
+    nonces = get_nonces_for_pk(
+        [key.account_id for (key, _) in test_account_keys], pk)
+    # Fail here rather than with a TypeError in a sender thread later on.
+    missing = [
+        key.account_id
+        for ((key, _), nonce) in zip(test_account_keys, nonces)
+        if nonce is None
+    ]
+    if missing:
+        raise RuntimeError(
+            f'No access key {pk} found for accounts: {", ".join(missing)}')
 
-    return [(Account(key, get_nonce_for_pk(key.account_id, key.pk),
-                     base_block_hash, rpc_info), i)
-            for (key, i) in test_account_keys]
+    return [(Account(key, nonce, base_block_hash, rpc_info), i)
+            for ((key, i), nonce) in zip(test_account_keys, nonces)]
 
 
 if __name__ == '__main__':
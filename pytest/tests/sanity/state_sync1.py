@@ -3,14 +3,17 @@
 # the end of epoch and produce blocks and chunks.
 
 import sys, time
+from concurrent.futures import ThreadPoolExecutor
 
 sys.path.append('lib')
 
 from cluster import start_cluster
 from configured_logger import logger
+from utils import poll_until
 
 BLOCK_WAIT = 40
 EPOCH_LENGTH = 80
+TIMEOUT = 150
 
 consensus_config = {
     "consensus": {
@@ -28,52 +31,63 @@ nodes = start_cluster(
 time.sleep(2)
 nodes[1].kill()
 
-cur_height = 0
 logger.info("step 1")
-while cur_height < BLOCK_WAIT:
-    status = nodes[0].get_status()
-    cur_height = status['sync_info']['latest_block_height']
-    time.sleep(2)
+poll_until(lambda: nodes[0].get_status()['sync_info']['latest_block_height']
+           >= BLOCK_WAIT,
+           timeout=TIMEOUT)
 nodes[1].start(nodes[1].node_key.pk, nodes[1].addr())
 time.sleep(2)
 
 logger.info("step 2")
-synced = False
-while cur_height <= EPOCH_LENGTH:
-    status0 = nodes[0].get_status()
+executor = ThreadPoolExecutor(max_workers=2)
+
+
+def sync_state():
+    """ Returns the higher of the two node heights and whether the nodes are in
+    sync, or None if that could not be determined yet. """
+    # Query both nodes concurrently so that their heights are comparable.
+    status0, status1 = executor.map(lambda node: node.get_status(), nodes[:2])
     block_height0 = status0['sync_info']['latest_block_height']
     block_hash0 = status0['sync_info']['latest_block_hash']
-    status1 = nodes[1].get_status()
-    block_height1 = status0['sync_info']['latest_block_height']
-    block_hash1 = status0['sync_info']['latest_block_hash']
-    if block_height0 > BLOCK_WAIT:
-        if block_height0 > block_height1:
-            try:
-                nodes[0].get_block(block_hash1)
-                if synced and abs(block_height0 - block_height1) >= 5:
-                    assert False, "Nodes fall out of sync"
-                synced = abs(block_height0 - block_height1) < 5
-            except Exception:
-                pass
-        else:
-            try:
-                nodes[1].get_block(block_hash0)
-                if synced and abs(block_height0 - block_height1) >= 5:
-                    assert False, "Nodes fall out of sync"
-                synced = abs(block_height0 - block_height1) < 5
-            except Exception:
-                pass
-    cur_height = max(block_height0, block_height1)
-    time.sleep(1)
-
-if not synced:
-    assert False, "Nodes are not synced"
+    block_height1 = status1['sync_info']['latest_block_height']
+    block_hash1 = status1['sync_info']['latest_block_hash']
+    height = max(block_height0, block_height1)
+    if block_height0 <= BLOCK_WAIT:
+        return height, None
+    if block_height0 > block_height1:
+        ahead, behind_hash = nodes[0], block_hash1
+    else:
+        ahead, behind_hash = nodes[1], block_hash0
+    try:
+        ahead.get_block(behind_hash)
+    except Exception:
+        return height, None
+    return height, abs(block_height0 - block_height1) < 5
+
+
+def check_synced():
+    height, synced = sync_state()
+    if not synced and height > EPOCH_LENGTH:
+        assert False, "Nodes are not synced"
+    return synced
+
+
+def check_epoch_passed():
+    height, synced = sync_state()
+    if synced is False:
+        assert False, "Nodes fall out of sync"
+    return height > EPOCH_LENGTH
+
+
+poll_until(check_synced, timeout=TIMEOUT, max_interval=1)
+poll_until(check_epoch_passed, timeout=TIMEOUT, max_interval=1)
 
 validator_info = nodes[0].json_rpc('validators', 'latest')
 if len(validator_info['result']['next_validators']) < 2:
     assert False, "Node 1 did not produce enough blocks"
 
-for i in range(2):
-    account0 = nodes[0].get_account("test%s" % i)['result']
-    account1 = nodes[1].get_account("test%s" % i)['result']
-    assert account0 == account1, "state diverged"
+account_ids = ["test%s" % i for i in range(2)]
+accounts0, accounts1 = executor.map(lambda node: node.get_accounts(account_ids),
+                                    nodes[:2])
+for account0, account1 in zip(accounts0, accounts1):
+    assert account0['result'] == account1['result'], "state diverged"
@@ -6,13 +6,12 @@ Changes runtime costs based on results from the new runtime parameter estimator.
 import sys
 import os
 import json
-from collections import OrderedDict
 
 home = sys.argv[1]
 output_home = sys.argv[2]
 
-config = json.load(open(os.path.join(home, 'output.json')),
-                   object_pairs_hook=OrderedDict)
+with open(os.path.join(home, 'output.json'), 'rb') as f:
+    config = json.loads(f.read())
 
 assert config['protocol_version'] == 10
 
@@ -153,4 +152,5 @@ config['runtime_config']['wasm_config']['ext_costs'] = {
     "promise_return": 558292404
 }
 
-json.dump(config, open(os.path.join(output_home, 'output.json'), 'w'), indent=2)
+with open(os.path.join(output_home, 'output.json'), 'w') as f:
+    f.write(json.dumps(config, indent=2))
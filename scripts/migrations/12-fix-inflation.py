@@ -6,13 +6,12 @@ No changes to state records.
 import sys
 import os
 import json
-from collections import OrderedDict
 
 home = sys.argv[1]
 output_home = sys.argv[2]
 
-config = json.load(open(os.path.join(home, 'output.json')),
-                   object_pairs_hook=OrderedDict)
+with open(os.path.join(home, 'output.json'), 'rb') as f:
+    config = json.loads(f.read())
 
 assert config['protocol_version'] == 11
 
@@ -21,4 +20,5 @@ config['online_max_threshold'] = [99, 100]
 config['online_min_threshold'] = [90, 100]
 config['chunk_producer_kickout_threshold'] = 90
 
-json.dump(config, open(os.path.join(output_home, 'output.json'), 'w'), indent=2)
+with open(os.path.join(output_home, 'output.json'), 'w') as f:
+    f.write(json.dumps(config, indent=2))
@@ -8,16 +8,26 @@ No state migration needed for this change.
 import sys
 import os
 import json
-from collections import OrderedDict
+import re
 
 home = sys.argv[1]
 output_home = sys.argv[2]
 
-config = json.load(open(os.path.join(home, 'output.json')),
-                   object_pairs_hook=OrderedDict)
+with open(os.path.join(home, 'output.json'), 'rb') as f:
+    data = f.read()
+
+# Only the protocol version changes, so patch it in place instead of
+# re-serializing the whole genesis.
+if re.findall(rb'"protocol_version"\s*:\s*(\d+)', data) == [b'12']:
+    with open(os.path.join(output_home, 'output.json'), 'wb') as f:
+        f.write(re.sub(rb'("protocol_version"\s*:\s*)12', rb'\g<1>13', data))
+    sys.exit(0)
+
+config = json.loads(data)
 
 assert config['protocol_version'] == 12
 
 config['protocol_version'] = 13
 
-json.dump(config, open(os.path.join(output_home, 'output.json'), 'w'), indent=2)
+with open(os.path.join(output_home, 'output.json'), 'w') as f:
+    f.write(json.dumps(config, indent=2))
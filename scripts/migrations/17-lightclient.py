@@ -9,15 +9,26 @@ Protocol changes include:
 import sys
 import os
 import json
-from collections import OrderedDict
+import re
 
 home = sys.argv[1]
 output_home = sys.argv[2]
 
-config = json.load(open(os.path.join(home, 'output.json')), object_pairs_hook=OrderedDict)
+with open(os.path.join(home, 'output.json'), 'rb') as f:
+    data = f.read()
+
+# Only the protocol version changes, so patch it in place instead of
+# re-serializing the whole genesis.
+if re.findall(rb'"protocol_version"\s*:\s*(\d+)', data) == [b'16']:
+    with open(os.path.join(output_home, 'output.json'), 'wb') as f:
+        f.write(re.sub(rb'("protocol_version"\s*:\s*)16', rb'\g<1>17', data))
+    sys.exit(0)
+
+config = json.loads(data)
 
 assert config['protocol_version'] == 16
 
 config['protocol_version'] = 17
 
-json.dump(config, open(os.path.join(output_home, 'output.json'), 'w'), indent=2)
+with open(os.path.join(output_home, 'output.json'), 'w') as f:
+    f.write(json.dumps(config, indent=2))
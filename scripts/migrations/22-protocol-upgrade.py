@@ -9,12 +9,12 @@ Protocol upgrade parameters, including:
 import sys
 import os
 import json
-from collections import OrderedDict
 
 home = sys.argv[1]
 output_home = sys.argv[2]
 
-config = json.load(open(os.path.join(home, 'output.json')), object_pairs_hook=OrderedDict)
+with open(os.path.join(home, 'output.json'), 'rb') as f:
+    config = json.loads(f.read())
 
 assert config['protocol_version'] == 21
 
@@ -24,4 +24,5 @@ config.pop('config_version')
 config['protocol_upgrade_stake_threshold'] = [4, 5]
 config['protocol_upgrade_num_epochs'] = 2
 
-json.dump(config, open(os.path.join(output_home, 'output.json'), 'w'), indent=2)
+with open(os.path.join(output_home, 'output.json'), 'w') as f:
+    f.write(json.dumps(config, indent=2))
@@ -8,12 +8,12 @@ It's computed using the total prepaid gas and the inflation using `pessimistic_g
 import sys
 import os
 import json
-from collections import OrderedDict
 
 home = sys.argv[1]
 output_home = sys.argv[2]
 
-config = json.load(open(os.path.join(home, 'output.json')), object_pairs_hook=OrderedDict)
+with open(os.path.join(home, 'output.json'), 'rb') as f:
+    config = json.loads(f.read())
 
 assert config['protocol_version'] == 25
 
@@ -22,4 +22,5 @@ config['protocol_version'] = 26
 config['runtime_config']['transaction_costs']['pessimistic_gas_price_inflation_ratio'] = [103, 100]
 config['runtime_config']['wasm_config']['limit_config']['max_total_prepaid_gas'] = 300000000000000
 
-json.dump(config, open(os.path.join(output_home, 'output.json'), 'w'), indent=2)
+with open(os.path.join(output_home, 'output.json'), 'w') as f:
+    f.write(json.dumps(config, indent=2))
@@ -1,20 +1,20 @@
 import sys
 import os
 import json
-from collections import OrderedDict
 
 home = sys.argv[1]
 output_home = sys.argv[2]
 
-config = json.load(open(os.path.join(home, 'output_config.json')),
-                   object_pairs_hook=OrderedDict)
+with open(os.path.join(home, 'output_config.json'), 'rb') as f:
+    config = json.loads(f.read())
 records_fname = [
     filename for filename in os.listdir(home)
     if filename.startswith('output_records_')
 ]
 assert len(records_fname) == 1, "Not found records file or found too many"
 
-records = json.load(open(os.path.join(home, records_fname[0])))
+with open(os.path.join(home, records_fname[0]), 'rb') as f:
+    records = json.loads(f.read())
 
 assert config['protocol_version'] == 4
 
@@ -64,4 +64,5 @@ config['runtime_config']['wasm_config']['limit_config'] = {
 }
 config['records'] = records
 
-json.dump(config, open(os.path.join(output_home, 'output.json'), 'w'), indent=2)
+with open(os.path.join(output_home, 'output.json'), 'w') as f:
+    f.write(json.dumps(config, indent=2))
@@ -9,13 +9,12 @@ Changes:
 import sys
 import os
 import json
-from collections import OrderedDict
 
 home = sys.argv[1]
 output_home = sys.argv[2]
 
-config = json.load(open(os.path.join(home, 'output.json')),
-                   object_pairs_hook=OrderedDict)
+with open(os.path.join(home, 'output.json'), 'rb') as f:
+    config = json.loads(f.read())
 
 assert config['protocol_version'] == 7
 
@@ -27,4 +26,5 @@ config['protocol_reward_rate'] = [1, 10]
 config['max_inflation_rate'] = [1, 20]
 config['runtime_config']['transaction_costs']['burnt_gas_reward'] = [3, 10]
 
-json.dump(config, open(os.path.join(output_home, 'output.json'), 'w'), indent=2)
+with open(os.path.join(output_home, 'output.json'), 'w') as f:
+    f.write(json.dumps(config, indent=2))
@@ -12,14 +12,13 @@ Changes:
 import sys
 import os
 import json
-from collections import OrderedDict
 import base64
 
 home = sys.argv[1]
 output_home = sys.argv[2]
 
-config = json.load(open(os.path.join(home, 'output.json')),
-                   object_pairs_hook=OrderedDict)
+with open(os.path.join(home, 'output.json'), 'rb') as f:
+    config = json.loads(f.read())
 
 assert config['protocol_version'] == 8
 
@@ -54,4 +53,5 @@ for record in config['records']:
         elif record["Account"]["account_id"] in validators:
             validators[record["Account"]["account_id"]]["amount"] = record[
                 "Account"]["account"]["locked"]
-json.dump(config, open(os.path.join(output_home, 'output.json'), 'w'), indent=2)
+with open(os.path.join(output_home, 'output.json'), 'w') as f:
+    f.write(json.dumps(config, indent=2))
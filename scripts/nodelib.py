@@ -1,10 +1,12 @@
 #!/usr/bin/env python3
 
 import argparse
+import functools
 import json
 import os
 import subprocess
-import urllib
+import urllib.request
+from concurrent.futures import ThreadPoolExecutor
 
 try:
     input = raw_input
@@ -12,16 +14,35 @@ except NameError:
     pass
 
 USER = str(os.getuid()) + ':' + str(os.getgid())
+CARGO = os.path.expanduser('~/.cargo/bin/cargo')
+
+
+"""Parses JSON file, cached until the file's modification time changes."""
+
+
+@functools.lru_cache(maxsize=4)
+def _load_json(path, mtime):
+    with open(path) as f:
+        return json.load(f)
+
+
+"""Loads JSON file via the cache. The result is shared, do not modify it."""
+
+
+def load_json(path):
+    return _load_json(path, os.path.getmtime(path))
+
+
 """Installs cargo/Rust."""
 
 
 def install_cargo():
     try:
-        subprocess.call([os.path.expanduser('~/.cargo/bin/cargo'), '--version'])
+        subprocess.call([CARGO, '--version'])
     except OSError:
         print("Installing Rust...")
-        subprocess.check_output('curl https://sh.rustup.rs -sSf | sh -s -- -y',
-                                shell=True)
+        rustup_init = urllib.request.urlopen('https://sh.rustup.rs').read()
+        subprocess.run(['sh', '-s', '--', '-y'], input=rustup_init, check=True)
 
 
 """Inits the node configuration using docker."""
@@ -67,7 +88,7 @@ def compile_package(package_name, is_release):
     flags = ['-p', package_name]
     if is_release:
         flags = ['--release'] + flags
-    code = subprocess.call([os.path.expanduser('cargo'), 'build'] + flags)
+    code = subprocess.call([CARGO, 'build'] + flags)
     if code != 0:
         print("Compilation failed, aborting")
         exit(code)
@@ -85,10 +106,11 @@ def check_and_setup(nodocker,
     if nodocker:
         compile_package('neard', is_release)
 
+    genesis_path = os.path.join(home_dir, 'genesis.json')
+    config_path = os.path.join(home_dir, 'config.json')
     chain_id = get_chain_id_from_flags(init_flags)
-    if os.path.exists(os.path.join(home_dir, 'config.json')):
-        genesis_config = json.loads(
-            open(os.path.join(os.path.join(home_dir, 'genesis.json'))).read())
+    if os.path.exists(config_path):
+        genesis_config = load_json(genesis_path)
         if chain_id != '' and genesis_config['chain_id'] != chain_id:
             if chain_id == 'testnet':
                 print(
@@ -128,7 +150,7 @@ def check_and_setup(nodocker,
         if not os.path.exists(testnet_genesis_records):
             print('Downloading testnet genesis records')
             url = 'https://s3-us-west-1.amazonaws.com/testnet.nearprotocol.com/testnet_genesis_records_%s.json' % testnet_genesis_hash
-            urllib.urlretrieve(url, testnet_genesis_records)
+            urllib.request.urlretrieve(url, testnet_genesis_records)
         init_flags.extend([
             '--genesis-config', 'near/res/testnet_genesis_config.json',
             '--genesis-records', testnet_genesis_records, '--genesis-hash',
@@ -140,11 +162,13 @@ def check_and_setup(nodocker,
     else:
         docker_init(image, home_dir, init_flags)
     if no_gas_price:
-        filename = os.path.join(home_dir, 'genesis.json')
-        genesis_config = json.load(open(filename))
+        # Not load_json: its cached dict must not be mutated.
+        with open(genesis_path) as f:
+            genesis_config = json.load(f)
         genesis_config['gas_price'] = 0
         genesis_config['min_gas_price'] = 0
-        json.dump(genesis_config, open(filename, 'w'))
+        with open(genesis_path, 'w') as f:
+            json.dump(genesis_config, f)
 
 
 def print_staking_key(home_dir):
@@ -160,18 +184,18 @@ def print_staking_key(home_dir):
           (key_file['account_id'], key_file['public_key']))
 
 
-"""Stops and removes given docker container."""
+"""Stops and removes given docker containers with one docker command each."""
 
 
-def docker_stop_if_exists(name):
+def docker_stop_if_exists(*names):
     try:
-        subprocess.Popen(['docker', 'stop', name],
+        subprocess.Popen(['docker', 'stop', *names],
                          stdout=subprocess.PIPE,
                          stderr=subprocess.PIPE).communicate()
     except subprocess.CalledProcessError:
         pass
     try:
-        subprocess.Popen(['docker', 'rm', name],
+        subprocess.Popen(['docker', 'rm', *names],
                          stdout=subprocess.PIPE,
                          stderr=subprocess.PIPE).communicate()
     except subprocess.CalledProcessError:
@@ -181,8 +205,7 @@ def docker_stop_if_exists(name):
 """Checks the ports saved in config.json"""
 
 
-def get_port(home_dir, net):
-    config = json.load(open(os.path.join(home_dir, 'config.json')))
+def get_port(config, net):
     p = config[net]['addr'][config[net]['addr'].find(':') + 1:]
     return p + ":" + p
 
@@ -192,16 +215,16 @@ def get_port(home_dir, net):
 
 def run_docker(image, home_dir, boot_nodes, telemetry_url, verbose):
     print("Starting NEAR client and Watchtower dockers...")
-    docker_stop_if_exists('watchtower')
-    docker_stop_if_exists('nearcore')
+    docker_stop_if_exists('watchtower', 'nearcore')
     # Start nearcore container, mapping home folder and ports.
     envs = [
         '-e',
         'BOOT_NODES=%s' % boot_nodes, '-e',
         'TELEMETRY_URL=%s' % telemetry_url
     ]
-    rpc_port = get_port(home_dir, 'rpc')
-    network_port = get_port(home_dir, 'network')
+    config = load_json(os.path.join(home_dir, 'config.json'))
+    rpc_port = get_port(config, 'rpc')
+    network_port = get_port(config, 'network')
     if verbose:
         envs.extend(['-e', 'VERBOSE=1'])
     subprocess.check_output(['mkdir', '-p', home_dir])
@@ -255,12 +278,18 @@ def setup_and_run(nodocker,
     if nodocker:
         install_cargo()
     else:
-        try:
-            subprocess.check_output(['docker', 'pull', image])
-            subprocess.check_output(['docker', 'pull', 'v2tec/watchtower'])
-        except subprocess.CalledProcessError as exc:
-            print("Failed to fetch docker containers: %s" % exc)
-            exit(1)
+        # Both pulls are network bound and independent, run them concurrently.
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            pulls = [
+                executor.submit(subprocess.check_output,
+                                ['docker', 'pull', img])
+                for img in [image, 'v2tec/watchtower']
+            ]
+        for pull in pulls:
+            exc = pull.exception()
+            if exc is not None:
+                print("Failed to fetch docker containers: %s" % exc)
+                exit(1)
 
     check_and_setup(nodocker, is_release, image, home_dir, init_flags,
                     no_gas_price)
@@ -277,8 +306,7 @@ def setup_and_run(nodocker,
 
 
 def stop_docker():
-    docker_stop_if_exists('watchtower')
-    docker_stop_if_exists('nearcore')
+    docker_stop_if_exists('watchtower', 'nearcore')
 
 
 def generate_node_key(home, is_release, nodocker, image):
@@ -8,15 +8,17 @@
 import json
 import os
 import sys
-from collections import OrderedDict
 
 filename = sys.argv[1]
-q = json.loads(open(filename).read(), object_pairs_hook=OrderedDict)
+with open(filename, 'rb') as f:
+    q = json.loads(f.read())
 
 records = q['records']
 q['records'] = []
 
-open(os.path.join(os.path.dirname(filename), 'genesis_config.json'),
-     'w').write(json.dumps(q, indent=2))
-open(os.path.join(os.path.dirname(filename), '_genesis_records.json'),
-     'w').write(json.dumps(records, indent=2))
+with open(os.path.join(os.path.dirname(filename), 'genesis_config.json'),
+          'w') as f:
+    f.write(json.dumps(q, indent=2))
+with open(os.path.join(os.path.dirname(filename), '_genesis_records.json'),
+          'w') as f:
+    f.write(json.dumps(records, indent=2))
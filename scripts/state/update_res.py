@@ -7,7 +7,6 @@ import subprocess
 import sys
 import json
 import os
-from collections import OrderedDict
 
 
 def main():
@@ -31,8 +30,8 @@ def near_init_genesis():
     subprocess.check_output(
         'cargo run -p neard --bin neard -- --home /tmp/near/update_res init --chain-id sample',
         shell=True)
-    genesis = json.load(open('/tmp/near/update_res/genesis.json'),
-                        object_pairs_hook=OrderedDict)
+    with open('/tmp/near/update_res/genesis.json', 'rb') as f:
+        genesis = json.loads(f.read())
     genesis['records'] = []
     # To avoid nearcore/res/genesis_config.json doesn't change everytime
     genesis['genesis_time'] = '1970-01-01T00:00:00.000000000Z'
@@ -44,15 +43,17 @@ def near_init_genesis():
 
 def update_res():
     genesis = near_init_genesis()
-    json.dump(genesis, open(genesis_config_path, 'w'), indent=2)
+    with open(genesis_config_path, 'w') as f:
+        f.write(json.dumps(genesis, indent=2))
     print('nearcore/res/genesis_config.json updated')
 
 
 def check_res():
     genesis = near_init_genesis()
-    res_genesis_config = json.load(open(genesis_config_path),
-                                   object_pairs_hook=OrderedDict)
-    if genesis != res_genesis_config:
+    with open(genesis_config_path, 'rb') as f:
+        res_genesis_config = json.loads(f.read())
+    # Compare serialized forms so that key order still matters.
+    if json.dumps(genesis) != json.dumps(res_genesis_config):
         print(
             'nearcore/res/genesis_config.json does not match `near init` generated'
         )
@@ -1,8 +1,10 @@
 #!/usr/bin/env python3
 
+import atexit
 import glob
 import os
 import subprocess
+import threading
 from concurrent.futures import ThreadPoolExecutor, as_completed
 import fcntl
 import re
@@ -13,6 +15,12 @@ fcntl.fcntl(1, fcntl.F_SETFL, 0)
 current_path = os.path.dirname(os.path.abspath(__file__))
 target_debug = os.path.abspath(os.path.join(current_path, '../target/debug'))
 
+# Shared test runtime containers carry the pid of the process that started
+# them under this label, so that stale ones can be found and reaped.
+TEST_RUNTIME_OWNER_LABEL = 'near.test-runtime.owner-pid'
+test_runtime_container = None
+test_runtime_container_lock = threading.Lock()
+
 
 def clean_binary_tests():
     if os.environ.get('RFCI_COMMIT'):
@@ -49,25 +57,92 @@ def run_doc_tests(nightly=False):
 
 
 def test_binaries(exclude=None):
+    exclude = [re.compile(e) for e in exclude or []]
     binaries = []
-    for f in glob.glob(f'{target_debug}/deps/*'):
-        fname = os.path.basename(f)
-        ext = os.path.splitext(fname)[1]
-        is_near_binary = filecmp.cmp(f, f'{target_debug}/near') or filecmp.cmp(
-            f, f'{target_debug}/neard')
-        if os.path.isfile(f) and not is_near_binary and ext == '':
-            if not exclude:
-                binaries.append(f)
-            elif not any(map(lambda e: re.match(e, fname), exclude)):
-                binaries.append(f)
-            else:
+    # DirEntry caches the file type, so this needs no extra stat per entry.
+    with os.scandir(f'{target_debug}/deps') as entries:
+        for entry in entries:
+            fname = entry.name
+            if fname.startswith('.') or os.path.splitext(fname)[1] != '':
+                continue
+            if not entry.is_file():
+                continue
+            f = entry.path
+            is_near_binary = filecmp.cmp(
+                f, f'{target_debug}/near') or filecmp.cmp(
+                    f, f'{target_debug}/neard')
+            if is_near_binary:
+                continue
+            if any(e.match(fname) for e in exclude):
                 print(f'========= ignore {f}')
+            else:
+                binaries.append(f)
     return binaries
 
 
-def run_test(test_binary, isolate=True):
-    """ Run a single test, save exitcode, stdout and stderr """
-    if isolate:
+def _is_process_alive(pid):
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        pass
+    return True
+
+
+def reap_stale_test_runtime_containers():
+    """ Remove shared test runtime containers whose owning process is gone,
+    e.g. because it was killed before its atexit cleanup could run """
+    label = TEST_RUNTIME_OWNER_LABEL
+    containers = subprocess.check_output(
+        [
+            'docker', 'ps', '-a', '--filter', f'label={label}', '--format',
+            f'{{{{.ID}}}} {{{{.Label "{label}"}}}}'
+        ],
+        universal_newlines=True)
+    for line in containers.splitlines():
+        container, owner_pid = line.split()
+        if not _is_process_alive(int(owner_pid)):
+            subprocess.call(['docker', 'rm', '-f', container],
+                            stdout=subprocess.DEVNULL)
+
+
+def get_test_runtime_container():
+    """ Start a long-lived test runtime container on first use, so tests run
+    with shared_container=True pay for a `docker exec` instead of a full
+    `docker run` each """
+    global test_runtime_container
+    with test_runtime_container_lock:
+        if test_runtime_container is None:
+            reap_stale_test_runtime_containers()
+            test_runtime_container = subprocess.check_output(
+                [
+                    'docker', 'run', '-d', '--rm', '--label',
+                    f'{TEST_RUNTIME_OWNER_LABEL}={os.getpid()}', '-u',
+                    f'{os.getuid()}:{os.getgid()}', '-v',
+                    f'{target_debug}:{target_debug}:ro',
+                    'nearprotocol/near-test-runtime', 'sleep', 'infinity'
+                ],
+                universal_newlines=True).strip()
+            atexit.register(subprocess.call,
+                            ['docker', 'rm', '-f', test_runtime_container],
+                            stdout=subprocess.DEVNULL)
+        return test_runtime_container
+
+
+def run_test(test_binary, isolate=True, shared_container=False):
+    """ Run a single test, save exitcode, stdout and stderr.
+
+    With isolate, each test gets a fresh container. With shared_container as
+    well, tests under target/debug instead run in one long-lived container,
+    sharing its /tmp, network namespace and ports. """
+    in_target_debug = test_binary.startswith(target_debug + '/')
+    if isolate and shared_container and in_target_debug:
+        cmd = [
+            'docker', 'exec', '-e', 'RUST_BACKTRACE=1',
+            get_test_runtime_container(), test_binary
+        ]
+    elif isolate:
         cmd = [
             'docker', 'run', '--rm', '-u', f'{os.getuid()}:{os.getgid()}', '-v',
             f'{test_binary}:{test_binary}', 'nearprotocol/near-test-runtime',
@@ -77,10 +152,12 @@ def run_test(test_binary, isolate=True):
         cmd = [test_binary]
     print(f'========= run test {test_binary}')
     if os.path.isfile(test_binary):
+        # Collect raw bytes and decode once at the end rather than running
+        # the whole output through the incremental text decoder.
         p = subprocess.Popen(cmd,
                              stdout=subprocess.PIPE,
-                             stderr=subprocess.PIPE,
-                             universal_newlines=True)
+                             stderr=subprocess.PIPE)
         stdout, stderr = p.communicate()
-        return (p.returncode, stdout, stderr)
+        return (p.returncode, stdout.decode('utf-8', errors='replace'),
+                stderr.decode('utf-8', errors='replace'))
     return -1, '', f'{test_binary} does not exist'